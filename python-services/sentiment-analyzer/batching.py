@@ -0,0 +1,153 @@
+"""
+Динамический батчинг запросов к анализатору
+"""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from sentiment_analyzer import BATCH_SIZE, AnalysisResult, SentimentAnalyzer
+
+# Максимальное время ожидания добора батча
+BATCH_MAX_WAIT_MS = float(os.getenv("BATCH_MAX_WAIT_MS", "5"))
+
+
+class MicroBatcher:
+    """
+    Собирает одиночные запросы /analyze в батчи для одного вызова модели
+    """
+
+    def __init__(
+        self,
+        analyzer: SentimentAnalyzer,
+        batch_size: int = BATCH_SIZE,
+        max_wait_ms: float = BATCH_MAX_WAIT_MS
+    ):
+        """
+        Инициализация батчера
+
+        Args:
+            analyzer: Анализатор настроений
+            batch_size: Максимальный размер батча
+            max_wait_ms: Максимальное ожидание добора батча в мс
+        """
+        self.analyzer = analyzer
+        self.batch_size = batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        # Единственный поток модели: вызовы идут последовательно и не блокируют event loop
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sentiment-model")
+        self.queue: Optional[asyncio.Queue] = None
+        self._worker_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """
+        Запуск фоновой задачи батчинга (вызывается из running event loop)
+        """
+        self.queue = asyncio.Queue()
+        self._worker_task = asyncio.create_task(self._worker())
+
+    async def stop(self) -> None:
+        """
+        Остановка фоновой задачи и потока модели
+        """
+        if self._worker_task:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+        self.executor.shutdown(wait=False)
+
+    async def submit(self, text: str, content_type: str = "news") -> AnalysisResult:
+        """
+        Постановка текста в очередь и ожидание результата анализа
+
+        Args:
+            text: Текст для анализа
+            content_type: Тип контента (news, social, other)
+
+        Returns:
+            Полный результат анализа
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, content_type, future))
+        return await future
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """
+        Выполнение функции в потоке модели
+
+        Args:
+            func: Функция анализатора
+            args: Аргументы функции
+
+        Returns:
+            Результат функции
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def _collect_batch(self) -> List[Tuple[str, str, asyncio.Future]]:
+        """
+        Сбор батча: до batch_size элементов или до истечения max_wait
+
+        Returns:
+            Список элементов очереди
+        """
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _worker(self) -> None:
+        """
+        Фоновая задача: батч-анализ и раздача результатов ожидающим запросам
+        """
+        while True:
+            batch = await self._collect_batch()
+            texts = [text for text, _, _ in batch]
+            content_types = [content_type for _, content_type, _ in batch]
+
+            try:
+                results = await self.run(self.analyzer.analyze_batch, texts, content_types)
+            except Exception as e:
+                # Один плохой текст не должен ронять чужие запросы батча: повторяем анализ
+                # по одному тексту, ошибку получают только запросы, которые падают сами по себе
+                print(f"⚠️ Micro-batch analysis failed, retrying per item: {e!r}")
+                await self._retry_per_item(batch)
+                continue
+
+            for (_, _, future), result in zip(batch, results):
+                # Клиент мог отключиться и отменить ожидание
+                if not future.done():
+                    future.set_result(result)
+
+    async def _retry_per_item(self, batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+        """
+        Анализ элементов упавшего батча по одному
+
+        Args:
+            batch: Элементы очереди
+        """
+        for text, content_type, future in batch:
+            # Клиент мог отключиться и отменить ожидание
+            if future.done():
+                continue
+            try:
+                result = await self.run(self.analyzer.analyze, text, content_type)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            if not future.done():
+                future.set_result(result)
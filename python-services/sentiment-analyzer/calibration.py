@@ -0,0 +1,145 @@
+"""
+Калибровочные тексты для статической INT8 квантизации FinBERT
+
+Набор типичных криптовалютных заголовков: по ним квантизатор собирает
+диапазоны активаций, поэтому тексты должны быть похожи на реальный трафик.
+Отложенная выборка HOLDOUT_TEXTS в калибровке не участвует и используется
+только для сверки меток INT8 модели с FP32.
+"""
+from typing import Tuple
+
+CALIBRATION_TEXTS: Tuple[str, ...] = (
+    "Bitcoin surges 10% after SEC approves first spot ETF",
+    "Ethereum price drops as network fees spike to yearly high",
+    "Binance faces new regulatory scrutiny in the European Union",
+    "Coinbase reports quarterly revenue above analyst expectations",
+    "Solana network suffers outage, validators coordinate restart",
+    "Crypto exchange hacked, $200 million in user funds stolen",
+    "Ripple wins partial victory in court case against the SEC",
+    "Cardano developers announce major protocol upgrade for next month",
+    "Dogecoin rallies after social media endorsement",
+    "Polygon partners with global payments company for stablecoin settlement",
+    "Bitcoin miners sell holdings as hashprice falls to record low",
+    "DeFi protocol loses $50 million in flash loan exploit",
+    "Tether mints another $1 billion USDT on Ethereum",
+    "Chainlink launches cross-chain interoperability protocol on mainnet",
+    "Crypto market consolidates as traders await Federal Reserve decision",
+    "Avalanche foundation unveils $100 million fund for gaming projects",
+    "Litecoin halving approaches, analysts expect increased volatility",
+    "Uniswap governance votes to activate protocol fee switch",
+    "Major bank launches bitcoin custody service for institutional clients",
+    "Regulators propose ban on crypto lending products for retail investors",
+    "NFT trading volumes decline for the third consecutive month",
+    "Bitcoin ETF outflows continue for a second week",
+    "Ethereum staking deposits reach new all-time high",
+    "Stablecoin issuer publishes reserve attestation showing full backing",
+    "Crypto lender files for bankruptcy protection amid withdrawal freeze",
+    "Altcoins plunge as bitcoin dominance climbs above 55%",
+    "Web3 startup raises $30 million in Series A funding round",
+    "Polkadot parachain auction attracts record participation",
+    "XRP price jumps after exchange relisting announcement",
+    "Analysts warn of a potential crash as leverage builds in futures markets",
+    "Bitcoin trades sideways with low volume over the weekend",
+    "Government announces plan to adopt bitcoin as legal tender",
+    "Security researchers discover critical bug in popular crypto wallet",
+    "Crypto adoption in emerging markets grows despite regulatory uncertainty",
+    "Exchange reports steady growth in active users this quarter",
+    "Ethereum layer-2 networks process more transactions than mainnet",
+    "Breaking: SEC sues major crypto exchange over unregistered securities",
+    "Bitcoin hash rate hits a new record as miners expand capacity",
+    "Token unlock schedule weighs on price of newly listed altcoin",
+    "Blockchain analytics firm traces stolen funds to mixing service",
+    "Bitcoin price slips below key support as liquidations mount",
+    "Ethereum developers set date for next network hard fork",
+    "Kraken expands services to new markets in Latin America",
+    "Bybit introduces proof of reserves for customer assets",
+    "Crypto fund inflows hit highest level since 2021",
+    "Solana token rebounds after weeks of steady decline",
+    "Cross-chain bridge exploit drains $80 million in wrapped tokens",
+    "Investors pull money from crypto funds for fourth straight week",
+    "Central bank digital currency pilot expands to more cities",
+    "Bitcoin options open interest reaches record ahead of expiry",
+    "Crypto exchange delists privacy coins citing compliance concerns",
+    "Ethereum gas fees fall to lowest level in months",
+    "Major payment processor adds support for stablecoin payouts",
+    "Bitcoin mining difficulty adjusts upward after hash rate surge",
+    "Court approves settlement in long-running crypto fraud case",
+    "Dogecoin whales move large sums to exchanges, sparking sell-off fears",
+    "Layer-1 blockchain raises $150 million from venture investors",
+    "Crypto derivatives volume falls as volatility compresses",
+    "Coinbase shares climb after bitcoin rallies over the weekend",
+    "Hackers exploit smart contract bug to mint unlimited tokens",
+    "Asset manager files application for spot ether ETF",
+    "Bitcoin network fees spike amid surge in inscription activity",
+    "Stablecoin briefly loses its peg during market turmoil",
+    "Crypto payments startup shuts down after failing to raise funds",
+    "Ethereum validators report missed attestations after client bug",
+    "Regulator grants license to crypto exchange in Dubai",
+    "Bitcoin long-term holders accumulate despite price weakness",
+    "Token prices slump after project founder steps down",
+    "Exchange outage leaves traders unable to close positions",
+    "Governments coordinate new rules for crypto asset reporting",
+    "Bitcoin gains as inflation data comes in below expectations",
+    "Crypto market loses $100 billion in value overnight",
+    "Decentralized exchange volumes overtake centralized rivals for a day",
+    "Ponzi scheme operators charged with defrauding crypto investors",
+    "Ethereum rollup launches native token airdrop for early users",
+    "Bitcoin treasury company buys another 10,000 BTC",
+    "Crypto lender resumes withdrawals after restructuring plan approved",
+    "Market makers pull liquidity from altcoin order books",
+    "Blockchain gaming platform reports surge in daily active wallets",
+    "Tax authority issues new guidance on staking rewards",
+    "Bitcoin hovers near $40,000 as traders eye jobs report",
+    "Binance chief steps down as part of settlement with authorities",
+    "Crypto exchange token jumps on news of buyback program",
+    "Mining company reports net loss on lower bitcoin production",
+    "Ethereum supply turns deflationary as burn rate rises",
+    "Hardware wallet maker faces backlash over key recovery service",
+    "Bitcoin futures premium widens as institutional demand returns",
+    "Investors sue exchange over frozen accounts",
+    "Crypto venture funding declines for a sixth quarter",
+    "Meme coin soars 300% in a day before sharp reversal",
+    "Exchange announces listing of new layer-2 token",
+    "Bitcoin addresses holding at least one coin reach record",
+    "Phishing attack on DeFi front-end steals user approvals",
+    "Bank regulators warn lenders about crypto concentration risks",
+    "Ethereum upgrade lowers data costs for rollups",
+    "Crypto index provider launches new large-cap benchmark",
+    "Trading firm reports losses after stablecoin depeg",
+    "Bitcoin rally stalls at resistance as profit-taking kicks in",
+    "Payment app lets users buy and sell bitcoin in the United Kingdom",
+    "Crypto markets remain calm ahead of options expiry",
+)
+
+HOLDOUT_TEXTS: Tuple[str, ...] = (
+    "Bitcoin soars to new all-time high as ETF demand accelerates",
+    "Ethereum tumbles 15% amid broad crypto market sell-off",
+    "Crypto exchange reports monthly trading volume figures",
+    "SEC delays decision on spot bitcoin ETF application",
+    "Hackers steal $120 million from decentralized lending protocol",
+    "Coinbase launches new derivatives exchange for retail traders",
+    "Bitcoin price unchanged as markets await inflation report",
+    "Solana outage halts transactions for several hours",
+    "Investment bank raises bitcoin price target citing strong inflows",
+    "Crypto lender halts withdrawals citing extreme market conditions",
+    "Cardano foundation publishes annual transparency report",
+    "Ripple expands partnership network across Asia-Pacific banks",
+    "Tether reports record quarterly profit from treasury holdings",
+    "Bitcoin miners face pressure after rewards are cut in half",
+    "Binance fined by regulators for anti-money laundering failures",
+    "Polygon token climbs after major network upgrade goes live",
+    "Stablecoin market capitalization holds steady this week",
+    "Dogecoin slides as social media hype fades",
+    "Kraken settles charges over its staking program",
+    "Ethereum network activity hits record as fees stay low",
+    "Crypto startup abandons token launch amid regulatory pressure",
+    "Exchange publishes updated schedule for system maintenance",
+    "Bitcoin rebounds strongly after weekend crash",
+    "DeFi protocol votes to adjust collateral parameters",
+    "Fraud charges filed against founders of collapsed crypto exchange",
+    "Nasdaq-listed miner expands operations with new data center",
+    "Crypto prices move sideways in thin holiday trading",
+    "Chainlink price surges after major bank adopts its oracle network",
+    "Bitcoin ETF sees largest daily outflow since launch",
+    "Blockchain consortium releases new technical specification",
+)
@@ -0,0 +1,13 @@
+"""
+Общие фикстуры тестов
+"""
+import pytest
+
+from sentiment_analyzer import SentimentAnalyzer
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """Анализатор без FinBERT и spaCy: проверяется только собственная логика"""
+    monkeypatch.setattr(SentimentAnalyzer, "load_models", lambda self: None)
+    return SentimentAnalyzer()
@@ -0,0 +1,79 @@
+"""
+Конфигурация gunicorn для Sentiment Analysis API
+
+Запуск: python prepare_models.py && gunicorn main:app -c gunicorn.conf.py
+"""
+import math
+import os
+
+# Верхняя граница числа воркеров по умолчанию: каждый держит свою сессию модели, кэш и spaCy
+_MAX_DEFAULT_WORKERS = 8
+
+
+def _available_cpus() -> int:
+    """
+    Число CPU, доступных контейнеру
+
+    multiprocessing.cpu_count() возвращает ядра хоста, а не лимит контейнера
+    (deploy.resources.limits.cpus), поэтому учитываются CPU affinity и квота cgroup.
+
+    Returns:
+        Количество доступных CPU (не меньше 1)
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+
+    quota = None
+    try:
+        # cgroup v2: "<quota> <period>" или "max <period>"
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            limit, period = f.read().split()
+        if limit != "max":
+            quota = int(limit) / int(period)
+    except (OSError, ValueError):
+        try:
+            # cgroup v1: -1 означает отсутствие квоты
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+                limit = int(f.read())
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+                period = int(f.read())
+            if limit > 0:
+                quota = limit / period
+        except (OSError, ValueError):
+            pass
+
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+_cpus = _available_cpus()
+
+# Модели на GPU нельзя разделять через fork: CUDA контекст не переживает fork
+_on_cpu = os.getenv("DEVICE", "cpu").lower() == "cpu"
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# Несколько процессов обходят GIL вокруг прямого прохода модели
+workers = int(os.getenv("WEB_CONCURRENCY", str(min(_cpus, _MAX_DEFAULT_WORKERS) if _on_cpu else 1)))
+
+# uvicorn воркер сам выбирает uvloop и httptools (ставятся с uvicorn[standard])
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Бэкенд инференса (читается так же, как в sentiment_analyzer)
+_backend = os.getenv("INFERENCE_BACKEND", "onnx").lower()
+
+# Модели загружаются в master процессе до fork только для onnx бэкенда: токенизатор и spaCy
+# разделяются воркерами через copy-on-write, а сессию ONNX Runtime (вместе с весами модели)
+# создает каждый воркер при старте приложения. Для torch и openvino master процесс
+# выполнял бы батч-токенизацию и прямой проход модели (трассировка, калибровка), после
+# которых пулы потоков токенизатора и OpenMP в воркерах зависают. Одноразовый экспорт и
+# квантизацию выполняет prepare_models.py до старта gunicorn, поэтому воркеры только
+# загружают готовые файлы
+preload_app = _on_cpu and _backend == "onnx"
+
+# Загрузка моделей воркером (трассировка torch, компиляция OpenVINO) без первичного экспорта
+timeout = 120
+
+# Ядра делятся между воркерами, чтобы потоки процессов не конкурировали друг с другом.
+# Выставляется до загрузки приложения, так как sentiment_analyzer читает переменную при импорте
+os.environ.setdefault("TORCH_THREADS", str(max(1, _cpus // workers)))
@@ -7,7 +7,8 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
-from sentiment_analyzer import SentimentAnalyzer
+from batching import MicroBatcher
+from sentiment_analyzer import AnalysisResult, SentimentAnalyzer
 
 # Создание приложения FastAPI
 app = FastAPI(
@@ -28,6 +29,9 @@ app.add_middleware(
 # Инициализация анализатора
 analyzer = SentimentAnalyzer()
 
+# Динамический батчинг одиночных запросов
+batcher = MicroBatcher(analyzer)
+
 
 class AnalyzeRequest(BaseModel):
     """Запрос на анализ"""
@@ -54,13 +58,60 @@ class AnalyzeResponse(BaseModel):
     processing_time: float = Field(..., description="Время обработки в мс")
 
 
+def _build_response(result: AnalysisResult, processing_time: float) -> AnalyzeResponse:
+    """
+    Сборка ответа из результата анализатора
+
+    Данные анализатора уже имеют нужные типы, поэтому модели создаются через
+    model_construct без повторной валидации каждого поля и каждой сущности.
+
+    Args:
+        result: Результат SentimentAnalyzer.analyze_batch
+        processing_time: Время обработки в мс
+
+    Returns:
+        AnalyzeResponse: Ответ API
+    """
+    return AnalyzeResponse.model_construct(
+        sentiment=result["sentiment"],
+        confidence=result["confidence"],
+        label=result["label"],
+        entities=[EntityInfo.model_construct(**entity) for entity in result["entities"].to_list()],
+        impact=result["impact"],
+        keywords=result["keywords"],
+        processing_time=processing_time
+    )
+
+
+def _neutral_response() -> AnalyzeResponse:
+    """Нейтральный результат для пустых текстов и ошибок анализа"""
+    return AnalyzeResponse.model_construct(
+        sentiment=0.0,
+        confidence=0.0,
+        label="neutral",
+        entities=[],
+        impact="low",
+        keywords=[],
+        processing_time=0.0
+    )
+
+
 @app.on_event("startup")
 async def startup_event():
     """Инициализация при запуске"""
     print("🚀 Starting Sentiment Analysis API...")
     print("📊 Loading models...")
-    # Модели загружаются в конструкторе SentimentAnalyzer
+    # Модели загружаются в конструкторе SentimentAnalyzer (в master процессе при preload),
+    # нативные сессии инференса - здесь, в процессе воркера
+    analyzer.create_sessions()
     print("✅ Models loaded successfully")
+    batcher.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Остановка батчера при завершении"""
+    await batcher.stop()
 
 
 @app.get("/")
@@ -79,6 +130,7 @@ async def health_check():
     return {
         "status": "healthy",
         "model": analyzer.model_name,
+        "backend": analyzer.backend,
         "spacy_model": analyzer.nlp.meta["name"]
     }
 
@@ -100,20 +152,12 @@ async def analyze_text(request: AnalyzeRequest):
     try:
         start_time = time.time()
 
-        # Анализ текста
-        result = analyzer.analyze(request.text, content_type=request.type)
+        # Анализ текста (запрос попадает в общий батч с конкурентными запросами)
+        result = await batcher.submit(request.text, content_type=request.type)
 
         processing_time = (time.time() - start_time) * 1000  # В миллисекундах
 
-        return AnalyzeResponse(
-            sentiment=result["sentiment"],
-            confidence=result["confidence"],
-            label=result["label"],
-            entities=[EntityInfo(**entity) for entity in result["entities"]],
-            impact=result["impact"],
-            keywords=result["keywords"],
-            processing_time=processing_time
-        )
+        return _build_response(result, processing_time)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -135,33 +179,38 @@ async def batch_analyze(requests: List[AnalyzeRequest]):
     if len(requests) > 100:
         raise HTTPException(status_code=400, detail="Maximum 100 texts per batch")
 
-    results = []
-    for req in requests:
-        try:
+    results = [_neutral_response() for _ in requests]
+
+    # Пустые тексты сразу получают нейтральный результат, в модель идут только непустые
+    indices = [idx for idx, req in enumerate(requests) if req.text and req.text.strip()]
+    if not indices:
+        return results
+
+    try:
+        start_time = time.time()
+
+        # Батч-анализ: один вызов токенизатора и модели на весь список
+        batch_results = await batcher.run(
+            analyzer.analyze_batch,
+            [requests[idx].text for idx in indices],
+            [requests[idx].type or "news" for idx in indices]
+        )
+
+        processing_time = (time.time() - start_time) * 1000 / len(indices)
+
+        for idx, result in zip(indices, batch_results):
+            results[idx] = _build_response(result, processing_time)
+    except Exception as e:
+        # Одна ошибка не должна обнулять весь батч: повторяем анализ по одному тексту,
+        # нейтральный результат остается только у текстов, которые падают сами по себе
+        print(f"⚠️ Batch analysis failed, retrying per item: {e!r}")
+        for idx in indices:
             start_time = time.time()
-            result = analyzer.analyze(req.text, content_type=req.type or "news")
-            processing_time = (time.time() - start_time) * 1000
-
-            results.append(AnalyzeResponse(
-                sentiment=result["sentiment"],
-                confidence=result["confidence"],
-                label=result["label"],
-                entities=[EntityInfo(**entity) for entity in result["entities"]],
-                impact=result["impact"],
-                keywords=result["keywords"],
-                processing_time=processing_time
-            ))
-        except Exception as e:
-            # При ошибке возвращаем нейтральный результат
-            results.append(AnalyzeResponse(
-                sentiment=0.0,
-                confidence=0.0,
-                label="neutral",
-                entities=[],
-                impact="low",
-                keywords=[],
-                processing_time=0.0
-            ))
+            try:
+                result = await batcher.run(analyzer.analyze, requests[idx].text, requests[idx].type or "news")
+                results[idx] = _build_response(result, (time.time() - start_time) * 1000)
+            except Exception as item_error:
+                print(f"❌ Analysis failed for batch item {idx}: {item_error!r}")
 
     return results
 
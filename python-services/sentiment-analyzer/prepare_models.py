@@ -0,0 +1,29 @@
+"""
+Одноразовая подготовка файлов модели до старта gunicorn
+
+Скачивает FinBERT и выполняет экспорт ONNX / квантизацию OpenVINO для
+INFERENCE_BACKEND, если файлов еще нет в кэше. Работает в отдельном процессе,
+поэтому воркеры gunicorn стартуют с готовыми файлами: тяжелая подготовка не идет
+в счет timeout воркера, и несколько воркеров не пишут в одну директорию модели.
+
+Запуск:
+    python prepare_models.py && gunicorn main:app -c gunicorn.conf.py
+"""
+import sys
+
+from sentiment_analyzer import prepare_model_files
+
+
+def main() -> int:
+    """
+    Подготовка файлов модели
+
+    Returns:
+        Код завершения процесса
+    """
+    prepare_model_files()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+Статическая per-channel INT8 квантизация FinBERT для ONNX Runtime
+
+Одноразовый скрипт: экспортирует FinBERT в FP32 ONNX, собирает диапазоны
+активаций на CALIBRATION_TEXTS и сохраняет finbert-int8.onnx рядом с моделью
+динамической квантизации. Если метки INT8 модели на отложенных текстах
+расходятся с FP32 больше чем в MAX_MISMATCHES случаях, файл не сохраняется
+и сервис продолжает использовать динамическую квантизацию.
+
+Встроенная выборка HOLDOUT_TEXTS мала (30 текстов) и ловит только грубые
+расхождения. Для проверки, где доля совпадений что-то значит, передайте
+файл с несколькими сотнями заголовков (по одному на строку) через HOLDOUT_FILE.
+
+Запуск:
+    python quantize_model.py
+    HOLDOUT_FILE=headlines.txt MAX_MISMATCHES=3 python quantize_model.py
+"""
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import onnxruntime as ort
+from onnxruntime.quantization import (
+    CalibrationDataReader,
+    CalibrationMethod,
+    QuantFormat,
+    QuantType,
+    quantize_static,
+)
+from onnxruntime.quantization.shape_inference import quant_pre_process
+from transformers import AutoConfig, AutoTokenizer
+
+from calibration import CALIBRATION_TEXTS, HOLDOUT_TEXTS
+from sentiment_analyzer import MAX_LENGTH, ONNX_MODEL_DIR, ONNX_STATIC_FILE
+
+MODEL_NAME = "ProsusAI/finbert"
+
+# Допустимое число расхождений меток INT8 и FP32 на отложенной выборке
+MAX_MISMATCHES = int(os.getenv("MAX_MISMATCHES", "0"))
+
+# Дополнительные отложенные тексты: файл с одним текстом на строку
+HOLDOUT_FILE = os.getenv("HOLDOUT_FILE")
+
+# Квантизуются только матричные умножения: LayerNorm, Softmax и GELU остаются в FP32
+OP_TYPES_TO_QUANTIZE = ["MatMul", "Gemm"]
+
+
+def _encode(tokenizer, text: str, input_names: Iterable[str]) -> Dict[str, np.ndarray]:
+    """
+    Токенизация одного текста во входы ONNX модели
+
+    Args:
+        tokenizer: Токенизатор FinBERT
+        text: Текст
+        input_names: Имена входов модели
+
+    Returns:
+        Словарь входов int64
+    """
+    encoded = tokenizer(text, truncation=True, max_length=MAX_LENGTH, return_tensors="np")
+    return {name: encoded[name].astype(np.int64) for name in input_names}
+
+
+class FinBertCalibrationReader(CalibrationDataReader):
+    """
+    Подача калибровочных текстов в квантизатор ONNX Runtime
+    """
+
+    def __init__(self, tokenizer, input_names: Iterable[str]):
+        """
+        Args:
+            tokenizer: Токенизатор FinBERT
+            input_names: Имена входов модели
+        """
+        input_names = list(input_names)
+        self._inputs = iter([_encode(tokenizer, text, input_names) for text in CALIBRATION_TEXTS])
+
+    def get_next(self) -> Optional[Dict[str, np.ndarray]]:
+        """Следующий калибровочный пример (None по окончании)"""
+        return next(self._inputs, None)
+
+
+def load_holdout_texts() -> List[str]:
+    """
+    Отложенная выборка: HOLDOUT_TEXTS и тексты из HOLDOUT_FILE
+
+    Returns:
+        Тексты, не участвующие в калибровке
+    """
+    texts = list(HOLDOUT_TEXTS)
+    if HOLDOUT_FILE:
+        with open(HOLDOUT_FILE, encoding="utf-8") as f:
+            texts.extend(line.strip() for line in f if line.strip())
+
+    calibration = set(CALIBRATION_TEXTS)
+    return [text for text in dict.fromkeys(texts) if text not in calibration]
+
+
+def _predict_labels(session: ort.InferenceSession, tokenizer, texts: List[str]) -> np.ndarray:
+    """
+    Метки модели на отложенной выборке
+
+    Args:
+        session: Сессия ONNX Runtime
+        tokenizer: Токенизатор FinBERT
+        texts: Отложенные тексты
+
+    Returns:
+        Массив id меток (по одному на текст)
+    """
+    input_names = [inp.name for inp in session.get_inputs()]
+    return np.array([
+        session.run(None, _encode(tokenizer, text, input_names))[0].argmax(axis=-1)[0]
+        for text in texts
+    ])
+
+
+def export_fp32_model(model_dir: str) -> str:
+    """
+    Экспорт FinBERT в FP32 ONNX (выполняется один раз)
+
+    Args:
+        model_dir: Директория модели
+
+    Returns:
+        Путь к FP32 модели
+    """
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+
+    fp32_dir = os.path.join(model_dir, "fp32")
+    fp32_path = os.path.join(fp32_dir, "model.onnx")
+
+    if not os.path.exists(fp32_path):
+        print(f"Exporting {MODEL_NAME} to FP32 ONNX: {fp32_dir}")
+        ORTModelForSequenceClassification.from_pretrained(MODEL_NAME, export=True).save_pretrained(fp32_dir)
+
+    return fp32_path
+
+
+def main() -> int:
+    model_dir = os.path.join(ONNX_MODEL_DIR, MODEL_NAME.replace("/", "--"))
+    int8_path = os.path.join(model_dir, ONNX_STATIC_FILE)
+    tmp_path = int8_path + ".tmp"
+
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, use_fast=True)
+    id2label = {int(k): v.lower() for k, v in AutoConfig.from_pretrained(MODEL_NAME).id2label.items()}
+
+    fp32_path = export_fp32_model(model_dir)
+    fp32_session = ort.InferenceSession(fp32_path, providers=["CPUExecutionProvider"])
+    input_names = [inp.name for inp in fp32_session.get_inputs()]
+
+    # Рекомендуемая ORT подготовка графа трансформера: оптимизация и вывод форм для квантизатора
+    prepared_path = os.path.join(os.path.dirname(fp32_path), "model-prepared.onnx")
+    quant_pre_process(fp32_path, prepared_path)
+
+    print(f"Calibrating static INT8 on {len(CALIBRATION_TEXTS)} texts")
+    quantize_static(
+        prepared_path,
+        tmp_path,
+        FinBertCalibrationReader(tokenizer, input_names),
+        quant_format=QuantFormat.QDQ,
+        op_types_to_quantize=OP_TYPES_TO_QUANTIZE,
+        per_channel=True,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        calibrate_method=CalibrationMethod.MinMax,
+    )
+
+    # Сверка меток с FP32 на текстах, не участвовавших в калибровке
+    holdout_texts = load_holdout_texts()
+    int8_session = ort.InferenceSession(tmp_path, providers=["CPUExecutionProvider"])
+    fp32_labels = _predict_labels(fp32_session, tokenizer, holdout_texts)
+    int8_labels = _predict_labels(int8_session, tokenizer, holdout_texts)
+
+    mismatches = np.flatnonzero(fp32_labels != int8_labels)
+    for idx in mismatches:
+        print(f"  mismatch: FP32={id2label[fp32_labels[idx]]} INT8={id2label[int8_labels[idx]]}: {holdout_texts[idx]}")
+
+    # Neutral класс считается отдельно: он первым страдает от обрезки диапазонов
+    neutral_ids = [label_id for label_id, label in id2label.items() if label == "neutral"]
+    neutral_total = int(np.isin(fp32_labels, neutral_ids).sum())
+    neutral_mismatches = int(np.isin(fp32_labels[mismatches], neutral_ids).sum())
+
+    print(
+        f"Label mismatches with FP32: {len(mismatches)}/{len(holdout_texts)} "
+        f"(neutral: {neutral_mismatches}/{neutral_total}), allowed: {MAX_MISMATCHES}"
+    )
+
+    if len(mismatches) > MAX_MISMATCHES:
+        os.remove(tmp_path)
+        print(f"❌ Too many mismatches, keeping dynamic INT8 ({model_dir})")
+        return 1
+
+    os.replace(tmp_path, int8_path)
+    print(f"✅ Saved static INT8 model: {int8_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
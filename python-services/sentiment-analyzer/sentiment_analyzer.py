@@ -1,10 +1,388 @@
 """
 Sentiment Analyzer - основная логика анализа
 """
+import os
+
+# Количество потоков вычислений PyTorch / OpenMP / ONNX Runtime (на процесс)
+TORCH_THREADS = int(os.getenv("TORCH_THREADS", str(os.cpu_count() or 1)))
+
+# Число OpenMP потоков должно быть выставлено до импорта torch и onnxruntime. OMP_WAIT_POLICY
+# остается PASSIVE: активное ожидание потоков между запросами отнимало бы ядра у spaCy и токенизатора.
+# TOKENIZERS_PARALLELISM не выставляется: без него Rust токенизатор параллелит батчи
+# и сам отключает параллелизм в процессе, созданном fork после батч-токенизации
+os.environ.setdefault("OMP_NUM_THREADS", str(TORCH_THREADS))
+
+import hashlib
 import re
-from typing import Dict, List, Any
+import string
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple, TypedDict
+import ahocorasick
+import numpy as np
+import onnxruntime as ort
 import spacy
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+import torch
+from spacy.symbols import ADJ, NOUN, PROPN, VERB
+from spacy.tokens import Doc
+from transformers import AutoConfig, AutoTokenizer
+
+from calibration import CALIBRATION_TEXTS
+
+# Модель FinBERT по умолчанию
+DEFAULT_MODEL_NAME = "ProsusAI/finbert"
+
+# Максимальная длина входа FinBERT в токенах для бэкендов с динамическим паддингом (onnx, torch eager/compile)
+MAX_LENGTH = int(os.getenv("MAX_LENGTH", "512"))
+
+# Длина входа бэкендов со статической формой (openvino, torch jit), до нее дополняется каждый текст.
+# Текст модели обрезается до 500 символов (~130 токенов для английского текста), поэтому 512 токенов
+# были бы в основном паддингом. Текст с большим количеством чисел или не на английском может дать
+# больше 160 WordPiece токенов: статические бэкенды обрезают его хвост, а onnx и eager классифицируют
+# целиком. Для одинаковых результатов на всех бэкендах STATIC_MAX_LENGTH поднимается до MAX_LENGTH
+STATIC_MAX_LENGTH = min(int(os.getenv("STATIC_MAX_LENGTH", "160")), MAX_LENGTH)
+
+# Максимальное количество текстов в одном вызове модели
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", "16"))
+
+# Параметры spaCy nlp.pipe для батч-анализа; n_process > 1 загружает модель в каждом процессе
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "32"))
+SPACY_N_PROCESS = int(os.getenv("SPACY_N_PROCESS", "1"))
+
+# Тексты короче MIN_TOKENS слов после предобработки не несут sentiment сигнала и не идут в модели
+MIN_TOKENS = int(os.getenv("MIN_TOKENS", "3"))
+
+# Размер LRU кэша результатов анализа (0 отключает кэш)
+ANALYSIS_CACHE_SIZE = int(os.getenv("ANALYSIS_CACHE_SIZE", "4096"))
+
+# Бэкенд инференса FinBERT: onnx, openvino или torch
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "onnx").lower()
+
+# Устройство для PyTorch; любое значение кроме cpu включает PyTorch бэкенд
+DEVICE = os.getenv("DEVICE", "cpu").lower()
+
+# Режим графа PyTorch бэкенда: jit (trace + optimize_for_inference, только CPU), compile или eager
+TORCH_GRAPH_MODE = os.getenv("TORCH_GRAPH_MODE", "jit").lower()
+
+# Порядок входов FinBERT: трассированная модель вызывается позиционно
+TORCH_INPUT_NAMES = ("input_ids", "attention_mask", "token_type_ids")
+
+# Захват прямого прохода в CUDA Graph при DEVICE=cuda (0 отключает)
+CUDA_GRAPHS = os.getenv("CUDA_GRAPHS", "1") == "1"
+
+# Формы CUDA Graphs (батч x длина): вызов идет через наименьший подходящий граф,
+# а не через полный (BATCH_SIZE, MAX_LENGTH). Входы длиннее наибольшей длины идут в eager
+CUDA_GRAPH_BATCH_SIZES = sorted({
+    size for size in map(int, os.getenv("CUDA_GRAPH_BATCH_SIZES", f"1,4,{BATCH_SIZE}").split(","))
+    if 0 < size <= BATCH_SIZE
+})
+CUDA_GRAPH_SEQ_LENGTHS = sorted({
+    length for length in map(int, os.getenv("CUDA_GRAPH_SEQ_LENGTHS", "64,128,256").split(","))
+    if 0 < length <= MAX_LENGTH
+})
+
+# Директория для экспортированных ONNX моделей (внутри кэша HuggingFace, который монтируется как volume)
+ONNX_MODEL_DIR = os.getenv(
+    "ONNX_MODEL_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "huggingface", "onnx")
+)
+
+# Знак sentiment score для меток FinBERT
+SENTIMENT_SIGNS = {
+    'positive': 1.0,
+    'negative': -1.0,
+    'neutral': 0.0
+}
+
+# Имя файла квантизованной модели, которое создает ORTQuantizer
+ONNX_QUANTIZED_FILE = "model_quantized.onnx"
+
+# Имя файла статической per-channel INT8 модели (создается скриптом quantize_model.py)
+ONNX_STATIC_FILE = "finbert-int8.onnx"
+
+# Директория для квантизованных OpenVINO моделей
+OPENVINO_MODEL_DIR = os.getenv(
+    "OPENVINO_MODEL_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "huggingface", "openvino")
+)
+
+# Имя файла IR модели, которое создает optimum-intel
+OPENVINO_MODEL_FILE = "openvino_model.xml"
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    """
+    Численно устойчивый softmax по последней оси
+
+    Args:
+        logits: Логиты модели
+
+    Returns:
+        Вероятности классов
+    """
+    exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+# Части речи ключевых слов (целочисленные id spaCy: сравнение без обращения к StringStore).
+# PROPN нужен, так как в исходном регистре тикеры и названия монет размечаются как имена собственные
+KEYWORD_POS = frozenset({NOUN, PROPN, ADJ, VERB})
+
+# Словарь криптовалют для entity extraction
+CRYPTO_KEYWORDS = frozenset({
+    'bitcoin', 'btc', 'ethereum', 'eth', 'cryptocurrency', 'crypto',
+    'binance', 'coinbase', 'blockchain', 'defi', 'nft', 'web3',
+    'solana', 'sol', 'cardano', 'ada', 'ripple', 'xrp', 'dogecoin',
+    'doge', 'polkadot', 'dot', 'avalanche', 'avax', 'polygon', 'matic',
+    'litecoin', 'ltc', 'chainlink', 'link', 'uniswap', 'uni',
+    'usdt', 'usdc', 'stablecoin', 'altcoin', 'token', 'coin'
+})
+
+# Ключевые слова для impact scoring
+HIGH_IMPACT_KEYWORDS = frozenset({
+    'hack', 'breach', 'crash', 'surge', 'skyrocket', 'plunge',
+    'collapse', 'approval', 'regulation', 'ban', 'adoption',
+    'partnership', 'launch', 'etf', 'sec', 'breaking', 'alert'
+})
+
+MEDIUM_IMPACT_KEYWORDS = frozenset({
+    'rise', 'fall', 'gain', 'loss', 'growth', 'decline',
+    'update', 'upgrade', 'development', 'announce', 'report'
+})
+
+# Маппинг меток spaCy на типы сущностей (ORG разбирается отдельно: биржа или компания)
+SPACY_LABEL_TYPES = {
+    'PERSON': 'person',
+    'PRODUCT': 'cryptocurrency'
+}
+
+# Типы сущностей и их компактные id для SoA представления EntitySet
+ENTITY_TYPES = ('cryptocurrency', 'exchange', 'company', 'person', 'organization')
+ENTITY_TYPE_IDS = {entity_type: idx for idx, entity_type in enumerate(ENTITY_TYPES)}
+
+
+class EntitySet:
+    """
+    Сущности текста в виде параллельных массивов (SoA) вместо списка dict
+    """
+
+    __slots__ = ('texts', 'starts', 'ends', 'type_ids')
+
+    def __init__(self, texts: List[str], starts: List[int], ends: List[int], type_ids: List[int]):
+        """
+        Инициализация набора сущностей
+
+        Args:
+            texts: Тексты сущностей
+            starts: Позиции начала в тексте
+            ends: Позиции конца в тексте
+            type_ids: Id типов из ENTITY_TYPE_IDS
+        """
+        self.texts = texts
+        self.starts = np.asarray(starts, dtype=np.int32)
+        self.ends = np.asarray(ends, dtype=np.int32)
+        self.type_ids = np.asarray(type_ids, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def count(self, entity_type: str) -> int:
+        """
+        Количество сущностей заданного типа (одна векторная маска)
+
+        Args:
+            entity_type: Тип сущности
+
+        Returns:
+            Количество сущностей
+        """
+        return int(np.count_nonzero(self.type_ids == ENTITY_TYPE_IDS[entity_type]))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """
+        Сериализация в публичный формат API (список dict)
+
+        Returns:
+            Список сущностей с text, type, start, end
+        """
+        return [
+            {
+                'text': text,
+                'type': ENTITY_TYPES[type_id],
+                'start': start,
+                'end': end
+            }
+            for text, start, end, type_id in zip(
+                self.texts, self.starts.tolist(), self.ends.tolist(), self.type_ids.tolist()
+            )
+        ]
+
+
+class AnalysisResult(TypedDict):
+    """
+    Результат анализа текста (внутренний формат анализатора)
+
+    Обычный dict без валидации: в модели ответа API он превращается
+    только на границе сервиса (main.py).
+    """
+    sentiment: float
+    confidence: float
+    label: str
+    entities: EntitySet
+    impact: str
+    keywords: List[str]
+
+
+# Понижение регистра только ASCII букв для не-ASCII текстов: в отличие от str.lower() длина строки
+# не меняется ('İ'.lower() дает 2 символа), поэтому позиции совпадений валидны для исходного текста.
+# Все словари ключевых слов ASCII, так что совпадения те же
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _ascii_lower(text: str) -> str:
+    """
+    Понижение регистра ASCII букв с сохранением длины и позиций символов
+
+    Args:
+        text: Текст
+
+    Returns:
+        Текст в нижнем регистре той же длины
+    """
+    # Для ASCII текста str.lower() сохраняет длину и вдвое быстрее str.translate
+    return text.lower() if text.isascii() else text.translate(_ASCII_LOWER)
+
+
+class CudaGraphBucket:
+    """
+    Захваченный CUDA Graph FinBERT и его статические буферы одной формы
+    """
+
+    __slots__ = ('graph', 'static_inputs', 'pinned_inputs', 'static_logits')
+
+    def __init__(self, graph, static_inputs: List, pinned_inputs: List, static_logits):
+        """
+        Args:
+            graph: torch.cuda.CUDAGraph
+            static_inputs: Входы графа на GPU (в порядке TORCH_INPUT_NAMES)
+            pinned_inputs: Page-locked буферы для копирования входов
+            static_logits: Выход графа (логиты на GPU)
+        """
+        self.graph = graph
+        self.static_inputs = static_inputs
+        self.pinned_inputs = pinned_inputs
+        self.static_logits = static_logits
+
+
+def _is_word_boundary(text: str, start: int, end: int) -> bool:
+    """
+    Проверка, что подстрока text[start:end] является целым словом (аналог \\b в regex)
+
+    Args:
+        text: Текст
+        start: Начало подстроки
+        end: Конец подстроки
+
+    Returns:
+        True, если слева и справа нет символов слова
+    """
+    before = text[start - 1] if start > 0 else ' '
+    after = text[end] if end < len(text) else ' '
+    return not (before.isalnum() or before == '_' or after.isalnum() or after == '_')
+
+
+def _select_backend() -> str:
+    """
+    Бэкенд инференса для текущего устройства
+
+    Returns:
+        INFERENCE_BACKEND на CPU; INT8 бэкенды работают только на CPU, для GPU остается torch
+    """
+    return INFERENCE_BACKEND if DEVICE == "cpu" else "torch"
+
+
+def _export_onnx_model(model_name: str, model_dir: str) -> None:
+    """
+    Экспорт FinBERT в ONNX с динамической INT8 квантизацией (AVX-512 VNNI)
+
+    Args:
+        model_name: Название модели
+        model_dir: Директория для сохранения модели
+    """
+    # optimum нужен только для экспорта и тянет за собой PyTorch
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    print(f"Exporting {model_name} to ONNX (one-time): {model_dir}")
+    ort_model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+    quantizer = ORTQuantizer.from_pretrained(ort_model)
+    quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=model_dir, quantization_config=quantization_config)
+
+
+def _quantize_openvino_model(model_name: str, tokenizer, model_dir: str) -> None:
+    """
+    Экспорт FinBERT в OpenVINO IR и статическая INT8 квантизация на калибровочных текстах
+
+    Args:
+        model_name: Название модели
+        tokenizer: Fast токенизатор модели
+        model_dir: Директория для сохранения модели
+    """
+    from datasets import Dataset
+    from optimum.intel import OVModelForSequenceClassification, OVQuantizer
+
+    print(f"Quantizing {model_name} with OpenVINO (one-time): {model_dir}")
+    ov_model = OVModelForSequenceClassification.from_pretrained(model_name, export=True)
+
+    calibration_dataset = Dataset.from_dict({"text": list(CALIBRATION_TEXTS)}).map(
+        lambda batch: tokenizer(
+            batch["text"],
+            padding="max_length",
+            truncation=True,
+            max_length=STATIC_MAX_LENGTH
+        ),
+        batched=True,
+        remove_columns=["text"]
+    )
+
+    quantizer = OVQuantizer.from_pretrained(ov_model)
+    quantizer.quantize(calibration_dataset=calibration_dataset, save_directory=model_dir)
+    tokenizer.save_pretrained(model_dir)
+
+
+def prepare_model_files(model_name: str = DEFAULT_MODEL_NAME) -> None:
+    """
+    Одноразовая подготовка файлов FinBERT для выбранного бэкенда
+
+    Скачивает модель и выполняет экспорт ONNX / квантизацию OpenVINO, если файлов
+    еще нет. Запускается отдельным процессом до старта gunicorn (prepare_models.py):
+    в воркерах эта работа шла бы в счет timeout и писала бы в одну директорию
+    из нескольких процессов, а в master процессе оставила бы пулы потоков до fork.
+
+    Args:
+        model_name: Название модели
+    """
+    backend = _select_backend()
+    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+    AutoConfig.from_pretrained(model_name)
+
+    if backend == "onnx":
+        model_dir = os.path.join(ONNX_MODEL_DIR, model_name.replace("/", "--"))
+        if not any(
+            os.path.exists(os.path.join(model_dir, name)) for name in (ONNX_STATIC_FILE, ONNX_QUANTIZED_FILE)
+        ):
+            _export_onnx_model(model_name, model_dir)
+    elif backend == "openvino":
+        model_dir = os.path.join(OPENVINO_MODEL_DIR, model_name.replace("/", "--"))
+        if not os.path.exists(os.path.join(model_dir, OPENVINO_MODEL_FILE)):
+            _quantize_openvino_model(model_name, tokenizer, model_dir)
+    else:
+        # Для torch достаточно скачать веса в кэш HuggingFace, трассировка выполняется в воркерах
+        from transformers import AutoModelForSequenceClassification
+        AutoModelForSequenceClassification.from_pretrained(model_name)
+
+    print(f"Model files ready for {backend} backend: {model_name}")
 
 
 class SentimentAnalyzer:
@@ -12,7 +390,19 @@ class SentimentAnalyzer:
     Анализатор настроений для криптовалютных текстов
     """
 
-    def __init__(self, model_name: str = "ProsusAI/finbert"):
+    # Схлопывание пробельных символов
+    _WS_RE = re.compile(r'\s+')
+
+    # HTML теги, URL и email одной альтернацией: текст сканируется за один проход.
+    # Без квадратичного отката: тег не содержит '<', email ищется только с начала токена
+    # (или сразу после '>') possessive квантификатором и не содержит '>' до '@'.
+    # В отличие от прежнего \S+@\S+ токены вида "x>y@z.com" очищаются только после '>'
+    _STRIP_RE = re.compile(r'<[^<>]+>|http\S+|www\.\S+|(?<![^\s>])[^\s@>]++@\S+')
+
+    # Названия бирж для ORG сущностей (поиск подстроки, как и прежде, но одним проходом)
+    _EXCHANGE_RE = re.compile(r'binance|coinbase|kraken|bybit')
+
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME):
         """
         Инициализация анализатора
 
@@ -20,67 +410,410 @@ class SentimentAnalyzer:
             model_name: Название модели для sentiment analysis
         """
         self.model_name = model_name
+        self.load_models()
+
+        # LRU кэш результатов: повторные заголовки из лент не гоняются через модели
+        self._cache: "OrderedDict[bytes, AnalysisResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Словари ключевых слов (общие неизменяемые множества модуля)
+        self.crypto_keywords = CRYPTO_KEYWORDS
+        self.high_impact_keywords = HIGH_IMPACT_KEYWORDS
+        self.medium_impact_keywords = MEDIUM_IMPACT_KEYWORDS
+
+        # Автомат Ахо-Корасик по криптовалютным терминам: один проход по тексту для всех терминов
+        self._crypto_automaton = ahocorasick.Automaton()
+        for crypto in self.crypto_keywords:
+            self._crypto_automaton.add_word(crypto, crypto)
+        self._crypto_automaton.make_automaton()
+
+        # Автомат по impact keywords: каждое совпадение несет вес ключевого слова
+        self._impact_automaton = ahocorasick.Automaton()
+        for keyword in self.medium_impact_keywords:
+            self._impact_automaton.add_word(keyword, (keyword, 1))
+        for keyword in self.high_impact_keywords:
+            self._impact_automaton.add_word(keyword, (keyword, 3))
+        self._impact_automaton.make_automaton()
+
+    def load_models(self) -> None:
+        """
+        Загрузка моделей: FinBERT (ONNX Runtime / OpenVINO INT8 или PyTorch) и spaCy
+        """
+        # Явное число потоков PyTorch: значения по умолчанию переподписывают ядра на многосокетных машинах
+        torch.set_num_threads(TORCH_THREADS)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Inter-op пул уже запущен (анализатор создается повторно в том же процессе)
+            pass
+        # Градиенты не нужны нигде в сервисе (режим потоко-локальный, инференс дополнительно
+        # обернут в inference_mode, так как модель вызывается из отдельного потока)
+        torch.set_grad_enabled(False)
 
         # Загрузка модели FinBERT для финансовых текстов
-        print(f"Loading sentiment model: {model_name}")
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
-        self.sentiment_pipeline = pipeline(
-            "sentiment-analysis",
-            model=self.model,
-            tokenizer=self.tokenizer,
-            top_k=None
+        print(f"Loading sentiment model: {self.model_name}")
+        # Rust (fast) токенизатор: батчи токенизируются параллельно без Python оберток pipeline
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+        if not self.tokenizer.is_fast:
+            raise RuntimeError(f"Fast tokenizer is not available for {self.model_name}")
+        self.id2label = {
+            int(idx): label.lower()
+            for idx, label in AutoConfig.from_pretrained(self.model_name).id2label.items()
+        }
+        # Знак sentiment для каждого id класса: результат считается индексацией массива
+        self.label_signs = np.array(
+            [SENTIMENT_SIGNS.get(self.id2label[idx], 0.0) for idx in range(len(self.id2label))],
+            dtype=np.float32
         )
 
+        self.backend = _select_backend()
+        # Динамический паддинг до самого длинного текста батча: ONNX Runtime и PyTorch
+        # работают с динамическими осями, для коротких заголовков это в разы меньше 512 токенов.
+        # Бэкенды со статической формой входа переключаются на max_length = STATIC_MAX_LENGTH
+        self.padding = True
+        self.max_length = MAX_LENGTH
+
+        print(f"Inference backend: {self.backend} (device: {DEVICE})")
+        # Нативные сессии ONNX Runtime / OpenVINO здесь не создаются: с preload_app (onnx бэкенд)
+        # этот код выполняется в master процессе gunicorn, а их пулы потоков не переживают fork.
+        # Сессии создает create_sessions() в каждом воркере
+        self.session = None
+        if self.backend == "onnx":
+            self.onnx_model_path = self._prepare_onnx_model()
+        elif self.backend == "openvino":
+            self.ov_model = self._load_openvino_model()
+            self.padding = "max_length"
+            self.max_length = STATIC_MAX_LENGTH
+        elif self.backend == "torch":
+            self.model = self._load_torch_model()
+        else:
+            raise ValueError(f"Unknown INFERENCE_BACKEND: {self.backend}")
+
         # Загрузка spaCy модели для NER
         print("Loading spaCy model for NER")
-        self.nlp = spacy.load("en_core_web_sm")
-
-        # Словарь криптовалют для entity extraction
-        self.crypto_keywords = {
-            'bitcoin', 'btc', 'ethereum', 'eth', 'cryptocurrency', 'crypto',
-            'binance', 'coinbase', 'blockchain', 'defi', 'nft', 'web3',
-            'solana', 'sol', 'cardano', 'ada', 'ripple', 'xrp', 'dogecoin',
-            'doge', 'polkadot', 'dot', 'avalanche', 'avax', 'polygon', 'matic',
-            'litecoin', 'ltc', 'chainlink', 'link', 'uniswap', 'uni',
-            'usdt', 'usdc', 'stablecoin', 'altcoin', 'token', 'coin'
-        }
+        # Синтаксический парсер и лемматизатор не используются (парсер - самый тяжелый компонент
+        # пайплайна), поэтому они не загружаются вовсе. attribute_ruler остается: в en_core_web_sm
+        # tagger выдает только tag_, а token.pos_ для extract_keywords проставляет attribute_ruler
+        self.nlp = spacy.load("en_core_web_sm", exclude=["parser", "lemmatizer"])
 
-        # Ключевые слова для impact scoring
-        self.high_impact_keywords = {
-            'hack', 'breach', 'crash', 'surge', 'skyrocket', 'plunge',
-            'collapse', 'approval', 'regulation', 'ban', 'adoption',
-            'partnership', 'launch', 'etf', 'sec', 'breaking', 'alert'
-        }
+    def _prepare_onnx_model(self) -> str:
+        """
+        Выбор квантизованной ONNX модели (экспорт выполняется один раз)
 
-        self.medium_impact_keywords = {
-            'rise', 'fall', 'gain', 'loss', 'growth', 'decline',
-            'update', 'upgrade', 'development', 'announce', 'report'
-        }
+        Статическая INT8 модель из quantize_model.py используется, если она есть,
+        иначе модель с динамической квантизацией.
 
-    def preprocess_text(self, text: str) -> str:
+        Returns:
+            Путь к ONNX модели
         """
-        Предобработка текста
+        model_dir = os.path.join(ONNX_MODEL_DIR, self.model_name.replace("/", "--"))
+        model_path = os.path.join(model_dir, ONNX_STATIC_FILE)
+
+        if not os.path.exists(model_path):
+            model_path = os.path.join(model_dir, ONNX_QUANTIZED_FILE)
+            if not os.path.exists(model_path):
+                _export_onnx_model(self.model_name, model_dir)
+
+        return model_path
+
+    def _create_onnx_session(self) -> ort.InferenceSession:
+        """
+        Создание сессии ONNX Runtime для подготовленной модели
+
+        Returns:
+            Сессия ONNX Runtime
+        """
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        opts.intra_op_num_threads = TORCH_THREADS
+
+        print(f"Loading ONNX model: {self.onnx_model_path}")
+        return ort.InferenceSession(
+            self.onnx_model_path,
+            sess_options=opts,
+            providers=["CPUExecutionProvider"]
+        )
+
+    def create_sessions(self) -> None:
+        """
+        Создание нативных сессий инференса в текущем процессе
+
+        Вызывается при старте каждого воркера (после fork). В master процессе
+        сессии не создаются, поэтому воркерам не достаются копии чужих пулов
+        потоков, которые нельзя ни использовать, ни корректно уничтожить.
+        Веса ONNX / OpenVINO моделей живут внутри сессии и у каждого воркера свои;
+        через copy-on-write разделяются токенизатор и spaCy (preload только для onnx).
+        """
+        if self.backend == "onnx" and self.session is None:
+            self.session = self._create_onnx_session()
+            self.input_names = [inp.name for inp in self.session.get_inputs()]
+        elif self.backend == "openvino" and self.ov_model.request is None:
+            self.ov_model.compile()
+
+    def _load_openvino_model(self):
+        """
+        Загрузка INT8 модели OpenVINO со статической формой входа (квантизация выполняется один раз)
+
+        Returns:
+            Модель OVModelForSequenceClassification (компилируется в create_sessions)
+        """
+        # optimum-intel нужен только для OpenVINO бэкенда
+        from optimum.intel import OVModelForSequenceClassification
+
+        model_dir = os.path.join(OPENVINO_MODEL_DIR, self.model_name.replace("/", "--"))
+
+        if not os.path.exists(os.path.join(model_dir, OPENVINO_MODEL_FILE)):
+            _quantize_openvino_model(self.model_name, self.tokenizer, model_dir)
+
+        print(f"Loading OpenVINO model: {model_dir}")
+        ov_model = OVModelForSequenceClassification.from_pretrained(model_dir, compile=False)
+        # Статическая длина последовательности позволяет OpenVINO специализировать ядра,
+        # размер батча остается динамическим для батчинга запросов
+        ov_model.reshape(-1, STATIC_MAX_LENGTH)
+        return ov_model
+
+    def _load_torch_model(self):
+        """
+        Загрузка FinBERT в PyTorch (fallback бэкенд, в том числе для GPU)
+
+        Returns:
+            Модель в режиме eval (eager, TorchScript или torch.compile)
+        """
+        from transformers import AutoModelForSequenceClassification
+
+        # TorchScript трассировка поддерживается только для CPU
+        self.graph_mode = TORCH_GRAPH_MODE
+        if self.graph_mode == "jit" and DEVICE != "cpu":
+            self.graph_mode = "eager"
+
+        model = AutoModelForSequenceClassification.from_pretrained(
+            self.model_name,
+            torchscript=self.graph_mode == "jit"
+        )
+        model = model.to(DEVICE).eval()
+
+        # BF16 (CPU) / FP16 (GPU) вместо FP32: вдвое меньше данных и tensor cores / AVX-512 BF16
+        self.torch_dtype = self._select_torch_dtype()
+        model = model.to(self.torch_dtype)
+
+        # Трассированный граф уже содержит BF16 операции, autocast нужен только вне TorchScript
+        self.use_autocast = self.torch_dtype != torch.float32 and self.graph_mode != "jit"
+
+        print(f"PyTorch compute dtype: {self.torch_dtype}, graph mode: {self.graph_mode}")
+        self.cuda_graphs: Dict[Tuple[int, int], CudaGraphBucket] = {}
+        if self.graph_mode == "jit":
+            return self._trace_torch_model(model)
+        if self.graph_mode == "compile":
+            # reduce-overhead сам использует CUDA Graphs на GPU
+            return torch.compile(model, mode="reduce-overhead")
+        if DEVICE.startswith("cuda") and CUDA_GRAPHS:
+            self._capture_cuda_graphs(model)
+        return model
+
+    def _capture_cuda_graphs(self, model: torch.nn.Module) -> None:
+        """
+        Захват прямого прохода FinBERT в CUDA Graphs для набора форм входа
+
+        Графы захватываются от большего к меньшему и делят один пул памяти:
+        вызовы модели последовательны, поэтому одновременно работает только один граф.
 
         Args:
-            text: Исходный текст
+            model: Модель в режиме eval на GPU
+        """
+        pool = None
+        for batch_size in reversed(CUDA_GRAPH_BATCH_SIZES):
+            for seq_len in reversed(CUDA_GRAPH_SEQ_LENGTHS):
+                bucket = self._capture_cuda_graph(model, batch_size, seq_len, pool)
+                pool = bucket.graph.pool()
+                self.cuda_graphs[(batch_size, seq_len)] = bucket
+
+        print(f"Captured CUDA graphs for shapes {sorted(self.cuda_graphs)}")
+
+    def _capture_cuda_graph(
+        self,
+        model: torch.nn.Module,
+        batch_size: int,
+        seq_len: int,
+        pool: Optional[Tuple[int, int]] = None
+    ) -> CudaGraphBucket:
+        """
+        Захват одного CUDA Graph: один replay вместо сотен запусков ядер
+
+        Граф захватывается на статических буферах формы (batch_size, seq_len);
+        входы меньшего размера дополняются нулями (attention_mask = 0).
+
+        Args:
+            model: Модель в режиме eval на GPU
+            batch_size: Число строк статического входа
+            seq_len: Длина статического входа в токенах
+            pool: Пул памяти ранее захваченного графа
 
         Returns:
-            Обработанный текст
+            Граф со статическими буферами
+        """
+        shape = (batch_size, seq_len)
+        static_inputs = [
+            torch.zeros(shape, dtype=torch.long, device=DEVICE) for _ in TORCH_INPUT_NAMES
+        ]
+        # Page-locked буферы для асинхронного копирования токенов на GPU
+        pinned_inputs = [
+            torch.zeros(shape, dtype=torch.long).pin_memory() for _ in TORCH_INPUT_NAMES
+        ]
+
+        with torch.no_grad(), self._autocast():
+            # Прогрев на отдельном стриме перед захватом (аллокации cuBLAS и кэширующего аллокатора)
+            warmup_stream = torch.cuda.Stream()
+            warmup_stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(warmup_stream):
+                for _ in range(3):
+                    model(*static_inputs)
+            torch.cuda.current_stream().wait_stream(warmup_stream)
+
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph, pool=pool):
+                static_logits = model(*static_inputs)[0]
+
+        return CudaGraphBucket(graph, static_inputs, pinned_inputs, static_logits)
+
+    def _select_cuda_graph(self, batch_size: int, seq_len: int) -> Optional[CudaGraphBucket]:
+        """
+        Наименьший захваченный граф, в который помещается вход
+
+        Args:
+            batch_size: Число текстов
+            seq_len: Длина входа в токенах
+
+        Returns:
+            Граф или None, если вход больше всех захваченных форм
+        """
+        for graph_batch_size in CUDA_GRAPH_BATCH_SIZES:
+            if graph_batch_size < batch_size:
+                continue
+            for graph_seq_len in CUDA_GRAPH_SEQ_LENGTHS:
+                if graph_seq_len >= seq_len:
+                    return self.cuda_graphs[(graph_batch_size, graph_seq_len)]
+            return None
+        return None
+
+    def _autocast(self) -> torch.autocast:
+        """
+        Контекст autocast для бэкенда torch
+
+        Returns:
+            torch.autocast с типом вычислений модели (выключен для FP32 и TorchScript)
+        """
+        return torch.autocast(
+            device_type=DEVICE.split(":")[0],
+            dtype=self.torch_dtype,
+            enabled=self.use_autocast
+        )
+
+    def _trace_torch_model(self, model: torch.nn.Module) -> torch.jit.ScriptModule:
+        """
+        Трассировка FinBERT в TorchScript и оптимизация графа для инференса
+        (слияние LayerNorm/MatMul/Add/GELU, без Python диспетчеризации на каждую операцию)
+
+        Args:
+            model: Модель в режиме eval, загруженная с torchscript=True
+
+        Returns:
+            Замороженный оптимизированный TorchScript модуль
+        """
+        # Трассировка фиксирует длину последовательности: входы дополняются до STATIC_MAX_LENGTH
+        self.padding = "max_length"
+        self.max_length = STATIC_MAX_LENGTH
+
+        example = self._encode(["x" * 32, "y" * 32])
+        with torch.no_grad():
+            traced = torch.jit.trace(
+                model,
+                tuple(torch.from_numpy(example[name]) for name in TORCH_INPUT_NAMES)
+            )
+        return torch.jit.optimize_for_inference(traced)
+
+    def _select_torch_dtype(self) -> torch.dtype:
+        """
+        Выбор типа вычислений PyTorch по возможностям устройства
+
+        Returns:
+            torch.float16 на GPU, torch.bfloat16 на CPU с AVX-512 BF16, иначе torch.float32
         """
-        # Удаление лишних пробелов
-        text = re.sub(r'\s+', ' ', text).strip()
+        if DEVICE.startswith("cuda"):
+            return torch.float16
 
-        # Удаление HTML тегов
-        text = re.sub(r'<[^>]+>', '', text)
+        # Приватный API PyTorch: без AVX-512 BF16 эмуляция медленнее FP32
+        is_bf16_supported = getattr(torch.cpu, "_is_avx512_bf16_supported", lambda: False)
+        return torch.bfloat16 if is_bf16_supported() else torch.float32
 
-        # Удаление URL
-        text = re.sub(r'http\S+|www\.\S+', '', text)
+    def _forward(self, encoded: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Прямой проход FinBERT на выбранном бэкенде
+
+        Args:
+            encoded: Выход токенизатора (NumPy массивы)
+
+        Returns:
+            Логиты модели формы (batch, num_labels)
+        """
+        if self.backend == "onnx":
+            # Без вызова create_sessions (использование анализатора вне сервиса) - ленивое создание
+            if self.session is None:
+                self.create_sessions()
+            return self.session.run(None, {name: encoded[name] for name in self.input_names})[0]
+
+        if self.backend == "openvino":
+            # optimum-intel сам компилирует модель при первом вызове, если create_sessions не вызывался
+            return self.ov_model(**encoded).logits
+
+        if self.cuda_graphs:
+            bucket = self._select_cuda_graph(*encoded["input_ids"].shape)
+            if bucket is not None:
+                return self._replay_cuda_graph(bucket, encoded)
+
+        inputs = [torch.from_numpy(encoded[name]).to(DEVICE) for name in TORCH_INPUT_NAMES]
+        with torch.inference_mode(), self._autocast():
+            # Первый выход - логиты (и для ModelOutput, и для кортежа TorchScript)
+            logits = self.model(*inputs)[0]
+        # Единственная синхронизация устройства: весь батч логитов сразу в NumPy (без BF16/FP16)
+        return logits.detach().float().cpu().numpy()
+
+    def _replay_cuda_graph(self, bucket: CudaGraphBucket, encoded: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Прямой проход через захваченный CUDA Graph
+
+        Args:
+            bucket: Граф, в форму которого помещается вход
+            encoded: Выход токенизатора с динамическим паддингом
+
+        Returns:
+            Логиты модели формы (batch, num_labels)
+        """
+        batch_size, seq_len = encoded["input_ids"].shape
+
+        with torch.inference_mode():
+            for name, pinned, static in zip(TORCH_INPUT_NAMES, bucket.pinned_inputs, bucket.static_inputs):
+                # Хвост буфера обнуляется: [PAD] токены с attention_mask = 0
+                pinned.zero_()
+                pinned[:batch_size, :seq_len].copy_(torch.from_numpy(encoded[name]))
+                static.copy_(pinned, non_blocking=True)
+
+            bucket.graph.replay()
+
+            # .cpu() синхронизирует стрим, поэтому pinned буферы можно переиспользовать в следующем вызове
+            return bucket.static_logits[:batch_size].float().cpu().numpy()
+
+    def preprocess_text(self, text: str) -> str:
+        """
+        Предобработка текста
 
-        # Удаление email
-        text = re.sub(r'\S+@\S+', '', text)
+        Args:
+            text: Исходный текст
 
-        return text
+        Returns:
+            Обработанный текст
+        """
+        # Удаление HTML тегов, URL и email, затем лишних пробелов
+        return self._WS_RE.sub(' ', self._STRIP_RE.sub('', text)).strip()
 
     def classify_sentiment(self, text: str) -> Dict[str, Any]:
         """
@@ -92,80 +825,138 @@ class SentimentAnalyzer:
         Returns:
             Dict с sentiment, confidence, label
         """
+        return self.classify_sentiment_batch([text])[0]
+
+    def classify_sentiment_batch(
+        self,
+        texts: List[str],
+        already_cleaned: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Батч-классификация настроений: один вызов токенизатора и модели на BATCH_SIZE текстов
+
+        Args:
+            texts: Тексты для анализа
+            already_cleaned: Тексты уже прошли preprocess_text (повторная очистка пропускается)
+
+        Returns:
+            Список Dict с sentiment, confidence, label (в порядке входных текстов)
+        """
         # Предобработка
-        clean_text = self.preprocess_text(text)
+        if not already_cleaned:
+            texts = [self.preprocess_text(text) for text in texts]
 
         # Ограничение длины текста для модели (512 токенов)
-        if len(clean_text) > 500:
-            clean_text = clean_text[:500]
+        clean_texts = [text[:500] for text in texts]
 
-        # Анализ с помощью FinBERT
-        results = self.sentiment_pipeline(clean_text)[0]
+        results = []
+        for offset in range(0, len(clean_texts), BATCH_SIZE):
+            # Анализ с помощью FinBERT
+            encoded = self._encode(clean_texts[offset:offset + BATCH_SIZE])
+            results.extend(self._postprocess_logits(self._forward(encoded)))
 
-        # Преобразование результатов FinBERT
-        sentiment_map = {
-            'positive': 1.0,
-            'negative': -1.0,
-            'neutral': 0.0
-        }
+        return results
 
-        # Находим результат с максимальной уверенностью
-        max_result = max(results, key=lambda x: x['score'])
-        label = max_result['label'].lower()
-        confidence = max_result['score']
+    def _encode(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Токенизация батча текстов fast токенизатором сразу в NumPy
 
-        # Нормализуем sentiment score
-        sentiment = sentiment_map.get(label, 0.0)
+        Args:
+            texts: Предобработанные тексты
 
-        # Более тонкая настройка sentiment на основе уверенности
-        if label != 'neutral':
-            sentiment = sentiment * confidence
+        Returns:
+            input_ids, attention_mask, token_type_ids формы (batch, seq_len)
+        """
+        encoded = self.tokenizer(
+            texts,
+            return_tensors="np",
+            padding=self.padding,
+            truncation=True,
+            max_length=self.max_length
+        )
+        return dict(encoded)
 
-        return {
-            'sentiment': sentiment,
-            'confidence': confidence,
-            'label': label
-        }
+    def _postprocess_logits(self, logits: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Преобразование логитов FinBERT в результаты классификации (векторно по всему батчу)
+
+        Args:
+            logits: Логиты модели формы (batch, num_labels)
 
-    def extract_entities(self, text: str) -> List[Dict[str, Any]]:
+        Returns:
+            Список Dict с sentiment, confidence, label
+        """
+        probs = _softmax(logits)
+
+        # Класс с максимальной уверенностью для каждого текста
+        label_ids = probs.argmax(axis=-1)
+        confidences = probs[np.arange(len(probs)), label_ids]
+
+        # Нормализуем sentiment score с учетом уверенности (neutral всегда 0)
+        sentiments = self.label_signs[label_ids] * confidences
+
+        return [
+            {
+                'sentiment': sentiment,
+                'confidence': confidence,
+                'label': self.id2label[label_id]
+            }
+            for label_id, confidence, sentiment in zip(
+                label_ids.tolist(), confidences.tolist(), sentiments.tolist()
+            )
+        ]
+
+    def extract_entities(
+        self,
+        text: str,
+        doc: Optional[Doc] = None,
+        text_lower: Optional[str] = None
+    ) -> EntitySet:
         """
         Извлечение сущностей (криптовалюты, компании, люди)
 
         Args:
             text: Текст для анализа
+            doc: Готовый spaCy Doc для text (если уже построен)
+            text_lower: Готовый _ascii_lower(text) (если уже вычислен)
 
         Returns:
-            Список сущностей
+            Набор сущностей (EntitySet)
         """
-        doc = self.nlp(text)
-        entities = []
+        if doc is None:
+            doc = self.nlp(text)
+        texts, starts, ends, type_ids = [], [], [], []
 
         # Извлечение сущностей с помощью spaCy
         for ent in doc.ents:
             entity_type = self._map_entity_type(ent.label_, ent.text.lower())
-            entities.append({
-                'text': ent.text,
-                'type': entity_type,
-                'start': ent.start_char,
-                'end': ent.end_char
-            })
-
-        # Дополнительное извлечение криптовалютных терминов
-        text_lower = text.lower()
-        for crypto in self.crypto_keywords:
+            texts.append(ent.text)
+            starts.append(ent.start_char)
+            ends.append(ent.end_char)
+            type_ids.append(ENTITY_TYPE_IDS[entity_type])
+
+        # Дополнительное извлечение криптовалютных терминов (один проход автомата по тексту)
+        seen_starts = set(starts)
+        crypto_type_id = ENTITY_TYPE_IDS['cryptocurrency']
+        if text_lower is None:
+            text_lower = _ascii_lower(text)
+        for end_index, crypto in self._crypto_automaton.iter(text_lower):
+            start = end_index - len(crypto) + 1
+            end = end_index + 1
+
             # Ищем целые слова (word boundaries)
-            pattern = r'\b' + re.escape(crypto) + r'\b'
-            for match in re.finditer(pattern, text_lower, re.IGNORECASE):
-                # Проверяем, не дублируется ли
-                if not any(e['start'] == match.start() for e in entities):
-                    entities.append({
-                        'text': text[match.start():match.end()],
-                        'type': 'cryptocurrency',
-                        'start': match.start(),
-                        'end': match.end()
-                    })
-
-        return entities
+            if not _is_word_boundary(text_lower, start, end):
+                continue
+
+            # Проверяем, не дублируется ли
+            if start not in seen_starts:
+                seen_starts.add(start)
+                texts.append(text[start:end])
+                starts.append(start)
+                ends.append(end)
+                type_ids.append(crypto_type_id)
+
+        return EntitySet(texts, starts, ends, type_ids)
 
     def _map_entity_type(self, spacy_label: str, text: str) -> str:
         """
@@ -182,20 +973,20 @@ class SentimentAnalyzer:
         if text in self.crypto_keywords:
             return 'cryptocurrency'
 
-        # Маппинг меток spaCy
-        if spacy_label in ['PERSON']:
-            return 'person'
-        elif spacy_label in ['ORG']:
-            # Проверяем, является ли биржей
-            if any(exchange in text for exchange in ['binance', 'coinbase', 'kraken', 'bybit']):
-                return 'exchange'
-            return 'company'
-        elif spacy_label in ['PRODUCT']:
-            return 'cryptocurrency'
+        # ORG дополнительно проверяем на биржу
+        if spacy_label == 'ORG':
+            return 'exchange' if self._EXCHANGE_RE.search(text) else 'company'
 
-        return 'organization'
+        # Маппинг меток spaCy
+        return SPACY_LABEL_TYPES.get(spacy_label, 'organization')
 
-    def calculate_impact(self, text: str, sentiment: float, entities: List[Dict]) -> str:
+    def calculate_impact(
+        self,
+        text: str,
+        sentiment: float,
+        entities: EntitySet,
+        text_lower: Optional[str] = None
+    ) -> str:
         """
         Расчет важности новости (impact score)
 
@@ -203,22 +994,17 @@ class SentimentAnalyzer:
             text: Текст
             sentiment: Оценка настроений
             entities: Извлеченные сущности
+            text_lower: Готовый _ascii_lower(text) (если уже вычислен)
 
         Returns:
             Уровень важности: high, medium, low
         """
-        text_lower = text.lower()
-        score = 0
+        if text_lower is None:
+            text_lower = _ascii_lower(text)
 
-        # High impact keywords
-        for keyword in self.high_impact_keywords:
-            if keyword in text_lower:
-                score += 3
-
-        # Medium impact keywords
-        for keyword in self.medium_impact_keywords:
-            if keyword in text_lower:
-                score += 1
+        # High (+3) и medium (+1) impact keywords за один проход автомата, каждое слово учитывается один раз
+        found_keywords = dict(weighted for _, weighted in self._impact_automaton.iter(text_lower))
+        score = sum(found_keywords.values())
 
         # Сильные sentiment = более важная новость
         if abs(sentiment) > 0.7:
@@ -227,10 +1013,10 @@ class SentimentAnalyzer:
             score += 1
 
         # Наличие криптовалютных entities повышает важность
-        crypto_entities = [e for e in entities if e['type'] == 'cryptocurrency']
-        if len(crypto_entities) >= 3:
+        crypto_count = entities.count('cryptocurrency')
+        if crypto_count >= 3:
             score += 2
-        elif len(crypto_entities) >= 1:
+        elif crypto_count >= 1:
             score += 1
 
         # Определение уровня
@@ -241,39 +1027,35 @@ class SentimentAnalyzer:
         else:
             return 'low'
 
-    def extract_keywords(self, text: str, top_n: int = 10) -> List[str]:
+    def extract_keywords(self, text: str, top_n: int = 10, doc: Optional[Doc] = None) -> List[str]:
         """
         Извлечение ключевых слов
 
         Args:
             text: Текст
             top_n: Количество ключевых слов
+            doc: Готовый spaCy Doc для text (если уже построен)
 
         Returns:
             Список ключевых слов
         """
-        doc = self.nlp(text.lower())
+        if doc is None:
+            doc = self.nlp(text)
 
-        # Извлекаем существительные, прилагательные и глаголы
-        keywords = []
-        for token in doc:
-            if (token.pos_ in ['NOUN', 'ADJ', 'VERB'] and
-                not token.is_stop and
-                not token.is_punct and
-                len(token.text) > 2):
-                keywords.append(token.text)
-
-        # Удаляем дубликаты, сохраняя порядок
-        seen = set()
-        unique_keywords = []
-        for kw in keywords:
-            if kw not in seen:
-                seen.add(kw)
-                unique_keywords.append(kw)
+        # Существительные, прилагательные и глаголы одним проходом;
+        # dict.fromkeys удаляет дубликаты, сохраняя порядок
+        keywords = dict.fromkeys(
+            token.lower_
+            for token in doc
+            if token.pos in KEYWORD_POS
+            and not token.is_stop
+            and not token.is_punct
+            and len(token) > 2
+        )
 
-        return unique_keywords[:top_n]
+        return list(keywords)[:top_n]
 
-    def analyze(self, text: str, content_type: str = "news") -> Dict[str, Any]:
+    def analyze(self, text: str, content_type: str = "news") -> AnalysisResult:
         """
         Полный анализ текста
 
@@ -284,21 +1066,168 @@ class SentimentAnalyzer:
         Returns:
             Полный результат анализа
         """
-        # Классификация настроений
-        sentiment_result = self.classify_sentiment(text)
+        return self.analyze_batch([text], [content_type])[0]
+
+    def analyze_batch(self, texts: List[str], content_types: Optional[List[str]] = None) -> List[AnalysisResult]:
+        """
+        Полный анализ нескольких текстов с батч-классификацией настроений
+
+        Args:
+            texts: Тексты для анализа
+            content_types: Типы контента (news, social, other)
+
+        Returns:
+            Список результатов анализа (в порядке входных текстов)
+        """
+        keys = [self._cache_key(text) for text in texts]
+        cached = self._cache_get_many(keys)
+
+        # Анализируем только промахи кэша, одинаковые тексты внутри батча - один раз
+        pending = OrderedDict(
+            (key, text) for key, text in zip(keys, texts) if key not in cached
+        )
+        if pending:
+            computed = self._analyze_uncached(list(pending.values()))
+            computed_by_key = dict(zip(pending.keys(), computed))
+            self._cache_put_many(computed_by_key)
+            cached.update(computed_by_key)
+
+        return [cached[key] for key in keys]
+
+    def _analyze_uncached(self, texts: List[str]) -> List[AnalysisResult]:
+        """
+        Полный анализ текстов без обращения к кэшу
+
+        Args:
+            texts: Тексты для анализа
+
+        Returns:
+            Список результатов анализа (в порядке входных текстов)
+        """
+        results: List[Optional[AnalysisResult]] = [None] * len(texts)
+
+        # Пустые и слишком короткие тексты получают нейтральный результат без вызова моделей
+        model_indices, clean_texts = [], []
+        for idx, text in enumerate(texts):
+            clean_text = self.preprocess_text(text)
+            if len(clean_text.split(maxsplit=MIN_TOKENS - 1)) < MIN_TOKENS:
+                results[idx] = self._neutral_result()
+            else:
+                model_indices.append(idx)
+                clean_texts.append(clean_text)
+
+        if model_indices:
+            model_texts = [texts[idx] for idx in model_indices]
+
+            # Классификация настроений одним батчем (тексты уже очищены проверкой длины)
+            sentiment_results = self.classify_sentiment_batch(clean_texts, already_cleaned=True)
+
+            # spaCy обрабатывает все тексты одним потоком nlp.pipe
+            docs = self.nlp.pipe(model_texts, batch_size=SPACY_BATCH_SIZE, n_process=SPACY_N_PROCESS)
+
+            for idx, text, sentiment_result, doc in zip(model_indices, model_texts, sentiment_results, docs):
+                results[idx] = self._build_result(text, sentiment_result, doc)
+
+        return results
+
+    @staticmethod
+    def _neutral_result() -> AnalysisResult:
+        """
+        Нейтральный результат для текстов без сигнала
+
+        Returns:
+            Результат анализа с нейтральным sentiment и без сущностей
+        """
+        return {
+            'sentiment': 0.0,
+            'confidence': 0.0,
+            'label': 'neutral',
+            'entities': EntitySet([], [], [], []),
+            'impact': 'low',
+            'keywords': []
+        }
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """
+        Ключ кэша для текста
+
+        Ключ строится по исходному тексту, а не по preprocess_text: позиции
+        сущностей считаются относительно исходного текста и отличаются у текстов
+        с одинаковой нормализованной формой.
+
+        Args:
+            text: Текст для анализа
+
+        Returns:
+            128-битный хэш текста
+        """
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _cache_get_many(self, keys: List[bytes]) -> Dict[bytes, AnalysisResult]:
+        """
+        Получение закэшированных результатов с обновлением их позиции в LRU
+
+        Args:
+            keys: Ключи кэша
+
+        Returns:
+            Найденные результаты по ключам
+        """
+        found = {}
+        with self._cache_lock:
+            for key in keys:
+                result = self._cache.get(key)
+                if result is not None:
+                    self._cache.move_to_end(key)
+                    found[key] = result
+        return found
+
+    def _cache_put_many(self, results: Dict[bytes, AnalysisResult]) -> None:
+        """
+        Сохранение результатов в кэш с вытеснением самых старых
+
+        Args:
+            results: Результаты по ключам
+        """
+        if ANALYSIS_CACHE_SIZE <= 0:
+            return
+
+        with self._cache_lock:
+            for key, result in results.items():
+                self._cache[key] = result
+                self._cache.move_to_end(key)
+            while len(self._cache) > ANALYSIS_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _build_result(self, text: str, sentiment_result: Dict[str, Any], doc: Doc) -> AnalysisResult:
+        """
+        Дополнение результата классификации сущностями, важностью и ключевыми словами
+
+        Args:
+            text: Текст для анализа
+            sentiment_result: Результат classify_sentiment
+            doc: spaCy Doc для text, общий для сущностей и ключевых слов
+
+        Returns:
+            Полный результат анализа
+        """
+        # Нижний регистр нужен и сущностям, и важности: вычисляем один раз
+        text_lower = _ascii_lower(text)
 
         # Извлечение сущностей
-        entities = self.extract_entities(text)
+        entities = self.extract_entities(text, doc, text_lower)
 
         # Расчет важности
         impact = self.calculate_impact(
             text,
             sentiment_result['sentiment'],
-            entities
+            entities,
+            text_lower
         )
 
         # Извлечение ключевых слов
-        keywords = self.extract_keywords(text)
+        keywords = self.extract_keywords(text, doc=doc)
 
         return {
             'sentiment': sentiment_result['sentiment'],
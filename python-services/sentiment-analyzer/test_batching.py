@@ -0,0 +1,80 @@
+"""
+Тесты динамического батчинга MicroBatcher без загрузки моделей
+
+Запуск: pytest test_batching.py
+"""
+import asyncio
+
+import pytest
+
+from batching import MicroBatcher
+
+
+@pytest.fixture
+def batch_calls(analyzer, monkeypatch):
+    """Подмена анализа: результат - сам текст, вызовы analyze_batch записываются"""
+    calls = []
+
+    def analyze_batch(texts, content_types=None):
+        calls.append(list(texts))
+        if "bad" in texts:
+            raise ValueError("bad text")
+        return [f"result:{text}" for text in texts]
+
+    def analyze(text, content_type="news"):
+        return analyze_batch([text], [content_type])[0]
+
+    monkeypatch.setattr(analyzer, "analyze_batch", analyze_batch)
+    monkeypatch.setattr(analyzer, "analyze", analyze)
+    return calls
+
+
+async def _submit_all(batcher, texts, delay=0.0):
+    """Конкурентная отправка текстов с паузой delay секунд перед каждым следующим"""
+    batcher.start()
+    try:
+        tasks = []
+        for text in texts:
+            tasks.append(asyncio.create_task(batcher.submit(text)))
+            await asyncio.sleep(delay)
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        await batcher.stop()
+
+
+def test_batches_up_to_batch_size(analyzer, batch_calls):
+    batcher = MicroBatcher(analyzer, batch_size=2, max_wait_ms=50)
+
+    asyncio.run(_submit_all(batcher, ["a", "b", "c", "d", "e"]))
+
+    assert batch_calls == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_batch_closes_after_max_wait(analyzer, batch_calls):
+    batcher = MicroBatcher(analyzer, batch_size=16, max_wait_ms=10)
+
+    # Второй текст приходит уже после того, как первый батч ушел в модель
+    asyncio.run(_submit_all(batcher, ["a", "b"], delay=0.2))
+
+    assert batch_calls == [["a"], ["b"]]
+
+
+def test_results_follow_submit_order(analyzer, batch_calls):
+    batcher = MicroBatcher(analyzer, batch_size=4, max_wait_ms=50)
+    texts = ["a", "b", "c", "d", "e", "f"]
+
+    results = asyncio.run(_submit_all(batcher, texts))
+
+    assert results == [f"result:{text}" for text in texts]
+
+
+def test_failing_text_does_not_fail_its_batch(analyzer, batch_calls):
+    batcher = MicroBatcher(analyzer, batch_size=4, max_wait_ms=50)
+
+    results = asyncio.run(_submit_all(batcher, ["a", "bad", "c"]))
+
+    assert results[0] == "result:a"
+    assert isinstance(results[1], ValueError)
+    assert results[2] == "result:c"
+    # Батч упал целиком, затем каждый текст проанализирован отдельно
+    assert batch_calls == [["a", "bad", "c"], ["a"], ["bad"], ["c"]]
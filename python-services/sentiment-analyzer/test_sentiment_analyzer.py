@@ -0,0 +1,185 @@
+"""
+Тесты логики SentimentAnalyzer без загрузки моделей
+
+Запуск: pytest test_sentiment_analyzer.py
+"""
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import sentiment_analyzer
+
+# spaCy Doc без сущностей: NER в этих тестах не проверяется
+EMPTY_DOC = SimpleNamespace(ents=())
+
+
+def test_crypto_offsets_after_non_ascii_prefix(analyzer):
+    # 'İ'.lower() дает два символа: позиции не должны сдвигаться
+    text = "İstanbul: bitcoin rallies hard"
+
+    entities = analyzer.extract_entities(text, EMPTY_DOC).to_list()
+
+    assert entities == [{'text': 'bitcoin', 'type': 'cryptocurrency', 'start': 10, 'end': 17}]
+    assert text[10:17] == 'bitcoin'
+
+
+@pytest.fixture
+def uncached_calls(analyzer, monkeypatch):
+    """Подмена анализа без кэша: результат - dict с текстом, вызовы записываются"""
+    calls = []
+
+    def analyze_uncached(texts):
+        calls.append(list(texts))
+        return [{'label': text} for text in texts]
+
+    monkeypatch.setattr(analyzer, "_analyze_uncached", analyze_uncached)
+    return calls
+
+
+def test_cache_hit_skips_analysis(analyzer, uncached_calls):
+    first = analyzer.analyze_batch(["a", "b"])
+    second = analyzer.analyze_batch(["b", "a"])
+
+    assert uncached_calls == [["a", "b"]]
+    assert second == [first[1], first[0]]
+
+
+def test_cache_evicts_least_recently_used(analyzer, uncached_calls, monkeypatch):
+    monkeypatch.setattr(sentiment_analyzer, "ANALYSIS_CACHE_SIZE", 2)
+
+    analyzer.analyze_batch(["a", "b"])
+    # Попадание делает "a" самым свежим, поэтому "c" вытесняет "b"
+    analyzer.analyze("a")
+    analyzer.analyze("c")
+    analyzer.analyze_batch(["a", "b"])
+
+    assert uncached_calls == [["a", "b"], ["c"], ["b"]]
+
+
+def test_cache_disabled_with_zero_size(analyzer, uncached_calls, monkeypatch):
+    monkeypatch.setattr(sentiment_analyzer, "ANALYSIS_CACHE_SIZE", 0)
+
+    analyzer.analyze("a")
+    analyzer.analyze("a")
+
+    assert uncached_calls == [["a"], ["a"]]
+    assert not analyzer._cache
+
+
+def test_repeated_texts_in_batch_analyzed_once(analyzer, uncached_calls):
+    results = analyzer.analyze_batch(["a", "b", "a"])
+
+    assert uncached_calls == [["a", "b"]]
+    assert [result['label'] for result in results] == ["a", "b", "a"]
+
+
+@pytest.fixture
+def model_calls(analyzer, monkeypatch):
+    """Подмена FinBERT и spaCy: записываются тексты, дошедшие до моделей"""
+    calls = []
+
+    def classify_sentiment_batch(texts, already_cleaned=False):
+        calls.append(list(texts))
+        return [{'sentiment': 0.9, 'confidence': 0.9, 'label': 'positive'} for _ in texts]
+
+    monkeypatch.setattr(analyzer, "classify_sentiment_batch", classify_sentiment_batch)
+    # load_models не вызывался, поэтому атрибута nlp еще нет
+    nlp = SimpleNamespace(pipe=lambda texts, **kwargs: [EMPTY_DOC for _ in texts])
+    monkeypatch.setattr(analyzer, "nlp", nlp, raising=False)
+    monkeypatch.setattr(analyzer, "_build_result", lambda text, sentiment_result, doc: sentiment_result)
+    return calls
+
+
+def test_short_texts_skip_models(analyzer, model_calls):
+    # После удаления HTML и URL остается меньше MIN_TOKENS (3) слов
+    results = analyzer.analyze_batch(["", "bitcoin up", "<b>btc</b> https://x.io pumps"])
+
+    assert model_calls == []
+    assert all(result['label'] == 'neutral' and result['confidence'] == 0.0 for result in results)
+
+
+def test_texts_at_min_tokens_reach_models(analyzer, model_calls):
+    results = analyzer.analyze_batch(["bitcoin up", "bitcoin goes up", "bitcoin goes way up"])
+
+    assert model_calls == [["bitcoin goes up", "bitcoin goes way up"]]
+    assert [result['label'] for result in results] == ['neutral', 'positive', 'positive']
+
+
+def test_batch_endpoint_skips_empty_texts(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setattr(sentiment_analyzer.SentimentAnalyzer, "load_models", lambda self: None)
+    import main
+
+    calls = []
+    analyze_batch = main.analyzer.analyze_batch
+
+    def spy(texts, content_types=None):
+        calls.append(list(texts))
+        return analyze_batch(texts, content_types)
+
+    monkeypatch.setattr(main.analyzer, "analyze_batch", spy)
+
+    response = TestClient(main.app).post(
+        "/batch",
+        json=[{"text": ""}, {"text": "   "}, {"text": "bitcoin up", "type": "social"}]
+    )
+
+    assert response.status_code == 200
+    # Пустые тексты не идут в анализатор, короткий текст не идет в модели
+    assert calls == [["bitcoin up"]]
+    assert [item['label'] for item in response.json()] == ['neutral'] * 3
+
+
+def test_ascii_lower_keeps_length():
+    assert sentiment_analyzer._ascii_lower("BTC ETF") == "btc etf"
+    assert sentiment_analyzer._ascii_lower("İSTANBUL BTC") == "İstanbul btc"
+
+
+def test_prepare_model_files_exports_onnx_once(tmp_path, monkeypatch):
+    exports = []
+    monkeypatch.setattr(sentiment_analyzer, "ONNX_MODEL_DIR", str(tmp_path))
+    monkeypatch.setattr(sentiment_analyzer, "_select_backend", lambda: "onnx")
+    monkeypatch.setattr(sentiment_analyzer.AutoTokenizer, "from_pretrained", lambda *args, **kwargs: None)
+    monkeypatch.setattr(sentiment_analyzer.AutoConfig, "from_pretrained", lambda *args, **kwargs: None)
+
+    def export(model_name, model_dir):
+        exports.append(model_dir)
+        os.makedirs(model_dir)
+        open(os.path.join(model_dir, sentiment_analyzer.ONNX_QUANTIZED_FILE), "w").close()
+
+    monkeypatch.setattr(sentiment_analyzer, "_export_onnx_model", export)
+
+    sentiment_analyzer.prepare_model_files("org/model")
+    sentiment_analyzer.prepare_model_files("org/model")
+
+    assert exports == [str(tmp_path / "org--model")]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("mail me at a.b@c.com now", "mail me at now"),
+    ("see https://x.io/a@b and www.y.com/q ok", "see and ok"),
+    ("<p>Bitcoin</p>   up", "Bitcoin up"),
+    ("<b>a@b.c</b> hi", "hi"),
+    ("@user hi", "@user hi"),
+    ("trailing@ a@ b", "trailing@ a@ b"),
+    # Email ищется только с начала токена или после '>', тег не содержит '<'
+    ("x>y@z.com ok", "x> ok"),
+    ("RT>@user hi", "RT>@user hi"),
+    ("<<b>> bold", "<> bold"),
+])
+def test_preprocess_strips_tags_urls_emails(analyzer, text, expected):
+    assert analyzer.preprocess_text(text) == expected
+
+
+@pytest.mark.parametrize("unit", ["a", "<a", ">", "a>"])
+def test_preprocess_is_linear_on_adversarial_input(analyzer, unit):
+    text = unit * (10_000 // len(unit))
+
+    start = time.perf_counter()
+    analyzer.preprocess_text(text)
+
+    # Линейный проход занимает ~1 мс; квадратичный откат занимал ~200 мс
+    assert time.perf_counter() - start < 0.05